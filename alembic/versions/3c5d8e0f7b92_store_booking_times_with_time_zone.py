@@ -0,0 +1,54 @@
+"""Store booking times with time zone
+
+Revision ID: 3c5d8e0f7b92
+Revises: e4a9b7c2d815
+Create Date: 2026-10-15 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5d8e0f7b92'
+down_revision: Union[str, None] = 'e4a9b7c2d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The zone the naive values were written in (the old code stored UTC + 3 hours). It is
+# fixed by the existing data, not by the TIMEZONE setting of the deployment.
+LEGACY_TIMEZONE = 'Europe/Moscow'
+
+
+def upgrade() -> None:
+    op.drop_constraint('no_overlap', 'booking')
+    for column in ('start_time', 'end_time'):
+        op.alter_column(
+            'booking',
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(timezone=False),
+            postgresql_using=f"{column} AT TIME ZONE '{LEGACY_TIMEZONE}'"
+        )
+    op.execute(
+        'ALTER TABLE booking ADD CONSTRAINT no_overlap '
+        'EXCLUDE USING gist (book_id WITH =, tstzrange(start_time, end_time) WITH &&) WHERE (active)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('no_overlap', 'booking')
+    for column in ('start_time', 'end_time'):
+        op.alter_column(
+            'booking',
+            column,
+            type_=sa.DateTime(timezone=False),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE '{LEGACY_TIMEZONE}'"
+        )
+    op.execute(
+        'ALTER TABLE booking ADD CONSTRAINT no_overlap '
+        'EXCLUDE USING gist (book_id WITH =, tsrange(start_time, end_time) WITH &&) WHERE (active)'
+    )
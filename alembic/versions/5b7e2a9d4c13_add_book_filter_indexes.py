@@ -0,0 +1,32 @@
+"""Add book filter indexes
+
+Revision ID: 5b7e2a9d4c13
+Revises: c1f68bdfb2a3
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2a9d4c13'
+down_revision: Union[str, None] = 'c1f68bdfb2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_book_price'), 'book', ['price'], unique=False)
+    op.create_index('ix_user_first_name_lower', 'user', [sa.text('lower(first_name)')], unique=False)
+    op.create_index('ix_user_last_name_lower', 'user', [sa.text('lower(last_name)')], unique=False)
+    op.create_index('ix_genre_name_lower', 'genre', [sa.text('lower(name)')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_genre_name_lower', table_name='genre')
+    op.drop_index('ix_user_last_name_lower', table_name='user')
+    op.drop_index('ix_user_first_name_lower', table_name='user')
+    op.drop_index(op.f('ix_book_price'), table_name='book')
@@ -0,0 +1,36 @@
+"""Add booking overlap index
+
+Revision ID: 8d3f6c1e2a47
+Revises: 5b7e2a9d4c13
+Create Date: 2026-10-15 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f6c1e2a47'
+down_revision: Union[str, None] = '5b7e2a9d4c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_booking_overlap',
+            'booking',
+            ['book_id', 'start_time', 'end_time'],
+            unique=False,
+            postgresql_where=sa.text('active'),
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_booking_overlap', table_name='booking', postgresql_concurrently=True)
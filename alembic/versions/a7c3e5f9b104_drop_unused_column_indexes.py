@@ -0,0 +1,39 @@
+"""Drop unused column indexes
+
+Revision ID: a7c3e5f9b104
+Revises: 3c5d8e0f7b92
+Create Date: 2026-10-15 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f9b104'
+down_revision: Union[str, None] = '3c5d8e0f7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Plain column indexes that no query filters or sorts on. Author and genre
+# filters go through the lower() expression indexes, which are kept.
+INDEXES = [
+    ('ix_book_title', 'book', 'title'),
+    ('ix_genre_name', 'genre', 'name'),
+    ('ix_user_avatar', 'user', 'avatar'),
+    ('ix_user_first_name', 'user', 'first_name'),
+    ('ix_user_last_name', 'user', 'last_name'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(name, table, [column], unique=False, postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""Add booking expiry index
+
+Revision ID: b5e1f7a3d928
+Revises: f2b8d4a6c019
+Create Date: 2026-10-15 17:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1f7a3d928'
+down_revision: Union[str, None] = 'f2b8d4a6c019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_booking_active_end_time',
+            'booking',
+            ['end_time'],
+            unique=False,
+            postgresql_where=sa.text('active'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_booking_active_end_time', table_name='booking', postgresql_concurrently=True)
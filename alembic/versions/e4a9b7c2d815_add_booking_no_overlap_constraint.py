@@ -0,0 +1,50 @@
+"""Add booking no_overlap exclusion constraint
+
+Revision ID: e4a9b7c2d815
+Revises: 8d3f6c1e2a47
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9b7c2d815'
+down_revision: Union[str, None] = '8d3f6c1e2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    # Existing data may violate the constraint (the old seed script wrote such rows):
+    # deactivate active bookings that end before they start, which tsrange rejects,
+    # and active bookings that overlap an earlier active booking of the same book.
+    op.execute('UPDATE booking SET active = false WHERE active AND start_time > end_time')
+    op.execute(
+        'UPDATE booking b SET active = false '
+        'WHERE b.active AND EXISTS ('
+        'SELECT 1 FROM booking o '
+        'WHERE o.active AND o.book_id = b.book_id AND o.id < b.id '
+        'AND tsrange(o.start_time, o.end_time) && tsrange(b.start_time, b.end_time))'
+    )
+    op.execute(
+        'ALTER TABLE booking ADD CONSTRAINT no_overlap '
+        'EXCLUDE USING gist (book_id WITH =, tsrange(start_time, end_time) WITH &&) WHERE (active)'
+    )
+    op.drop_index('ix_booking_overlap', table_name='booking')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_booking_overlap',
+        'booking',
+        ['book_id', 'start_time', 'end_time'],
+        unique=False,
+        postgresql_where=sa.text('active'),
+        postgresql_include=['id']
+    )
+    op.drop_constraint('no_overlap', 'booking')
@@ -0,0 +1,49 @@
+"""Index foreign keys
+
+Revision ID: f2b8d4a6c019
+Revises: a7c3e5f9b104
+Create Date: 2026-10-15 17:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4a6c019'
+down_revision: Union[str, None] = 'a7c3e5f9b104'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_book_author_id', 'book', 'author_id'),
+    ('ix_booking_book_id', 'booking', 'book_id'),
+    ('ix_booking_user_id', 'booking', 'user_id'),
+    ('ix_book_genre_genre_id', 'book_genre', 'genre_id'),
+]
+
+
+def upgrade() -> None:
+    # The composite primary key also serves lookups by book_id. Incomplete and
+    # duplicate links are removed first so that it can be created.
+    op.execute('DELETE FROM book_genre WHERE book_id IS NULL OR genre_id IS NULL')
+    op.execute(
+        'DELETE FROM book_genre a USING book_genre b '
+        'WHERE a.ctid > b.ctid AND a.book_id = b.book_id AND a.genre_id = b.genre_id'
+    )
+    op.create_primary_key('book_genre_pkey', 'book_genre', ['book_id', 'genre_id'])
+
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(name, table, [column], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+    op.drop_constraint('book_genre_pkey', 'book_genre', type_='primary')
+    op.alter_column('book_genre', 'book_id', nullable=True)
+    op.alter_column('book_genre', 'genre_id', nullable=True)
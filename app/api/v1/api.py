@@ -1,8 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints import books, users, genres, booking
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 api_router.include_router(books.router, prefix="/books", tags=["books"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(genres.router, prefix="/genres", tags=["genres"])
@@ -1,7 +1,8 @@
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.responses import json_response
 from app.crud.crud_booking import crud_booking
 from app.schemas.booking import Booking, BookingCreate, BookingUpdate
 from app.core.init_db import get_session
@@ -26,17 +27,14 @@ async def create_booking(
     Raises:
         HTTPException: If the booking cannot be created or if the booking is already in the specified period.
     """
-    try:
-        booking = await crud_booking.create(db=db, obj_in=booking_in)
-        if not booking:
-            raise HTTPException(status_code=400, detail="Book is already booked in the specified period")
-        return booking
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    booking = await crud_booking.create(db=db, obj_in=booking_in)
+    if not booking:
+        raise HTTPException(status_code=400, detail="Book is already booked in the specified period")
+    return json_response(booking, Booking)
 
 @router.get("/", response_model=List[Booking])
 async def read_bookings(
-    skip: int = 0,
+    after_id: Optional[int] = None,
     limit: int = 10,
     db: AsyncSession = Depends(get_session)
 ):
@@ -44,7 +42,7 @@ async def read_bookings(
     Retrieve a list of bookings.
 
     Args:
-        skip (int): Number of items to skip. Defaults to 0.
+        after_id (Optional[int]): Return only items with an ID greater than this, i.e. the last ID of the previous page. Defaults to None.
         limit (int): Maximum number of items to return. Defaults to 10.
         db (AsyncSession): The database session dependency.
 
@@ -54,11 +52,8 @@ async def read_bookings(
     Raises:
         HTTPException: If there is an error retrieving the bookings.
     """
-    try:
-        bookings = await crud_booking.get_multi(db=db, skip=skip, limit=limit)
-        return bookings
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    bookings = await crud_booking.get_multi(db=db, after_id=after_id, limit=limit)
+    return json_response(bookings, List[Booking])
 
 @router.get("/{booking_id}", response_model=Booking)
 async def read_booking(
@@ -78,13 +73,10 @@ async def read_booking(
     Raises:
         HTTPException: If the booking is not found or if there is an error retrieving it.
     """
-    try:
-        booking = await crud_booking.get(db=db, id=booking_id)
-        if not booking:
-            raise HTTPException(status_code=404, detail="Booking not found")
-        return booking
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    booking = await crud_booking.get(db=db, id=booking_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return json_response(booking, Booking)
 
 @router.put("/{booking_id}", response_model=Booking)
 async def update_booking(
@@ -106,23 +98,16 @@ async def update_booking(
     Raises:
         HTTPException: If the booking is not found, if the booking is already in the specified period, or if there is an error updating it.
     """
-    try:
-        booking = await crud_booking.get(db=db, id=booking_id)
-        if not booking:
-            raise HTTPException(status_code=404, detail="Booking not found")
-        
-        updated_booking = await crud_booking.update(db=db, db_obj=booking, obj_in=booking_in)
-        if not updated_booking:
-            raise HTTPException(status_code=400, detail="Book is already booked in the specified period")
-        return updated_booking
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@router.delete("/{booking_id}", response_model=Booking)
+    booking = await crud_booking.update(db=db, id=booking_id, obj_in=booking_in)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return json_response(booking, Booking)
+
+@router.delete("/{booking_id}", status_code=204)
 async def delete_booking(
     booking_id: int,
     db: AsyncSession = Depends(get_session)
-):
+) -> None:
     """
     Delete a booking by ID.
 
@@ -130,19 +115,12 @@ async def delete_booking(
         booking_id (int): The ID of the booking to delete.
         db (AsyncSession): The database session dependency.
 
-    Returns:
-        Booking: The deleted booking.
-
     Raises:
         HTTPException: If the booking is not found or if there is an error deleting it.
     """
-    try:
-        booking = await crud_booking.remove(db=db, id=booking_id)
-        if not booking:
-            raise HTTPException(status_code=404, detail="Booking not found")
-        return booking
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    deleted_id = await crud_booking.remove(db=db, id=booking_id)
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Booking not found")
 
 @router.put("/{booking_id}/cancel", response_model=Booking)
 async def cancel_booking(
@@ -162,11 +140,7 @@ async def cancel_booking(
     Raises:
         HTTPException: If the booking is not found or if there is an error canceling it.
     """
-    try:
-        booking = await crud_booking.cancel(db=db, id=booking_id)
-        if not booking:
-            raise HTTPException(status_code=404, detail="Booking not found")
-        
-        return booking
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    booking = await crud_booking.cancel(db=db, id=booking_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return json_response(booking, Booking)
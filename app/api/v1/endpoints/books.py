@@ -1,12 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+from app.core.cache import response_cache
+from app.core.responses import _type_adapter, json_response
 from app.crud.crud_book import crud_book
 from app.schemas import book
 from app.core.init_db import get_session
 
 router = APIRouter()
 
+_BOOK_LIST = _type_adapter(List[book.Book])
+
+
+def _serialize_batch(books: list) -> bytes:
+    """
+    Validate a batch of books and serialize it as the items of a JSON array.
+
+    Args:
+        books (list): The book objects to serialize.
+
+    Returns:
+        bytes: The serialized books, separated by commas, without the enclosing brackets.
+    """
+    return _BOOK_LIST.dump_json(_BOOK_LIST.validate_python(books, from_attributes=True))[1:-1]
+
+
+async def _page_response(request: Request, batches: AsyncIterator[list], total: int) -> Response:
+    """
+    Serialize a page of books as a `book.BookPage` JSON document.
+
+    A page that fits in a single fetch batch (every page of the default size) is
+    returned as a regular response with a Content-Length, so it is cached and gets an
+    ETag. Only larger pages are streamed batch by batch; they are neither cached nor
+    tagged, since both would need the whole body in memory. The first batch is always
+    serialized before the response starts, so a serialization error fails the request
+    instead of truncating a 200 response.
+
+    Args:
+        request (Request): The incoming request, used as the cache key.
+        batches (AsyncIterator[list]): Batches of book objects on the page.
+        total (int): The total number of matching books.
+
+    Returns:
+        Response: The serialized page.
+    """
+    first = _serialize_batch(await anext(batches, []))
+    second = await anext(batches, None)
+    if second is None:
+        content = b'{"items":[' + first + b'],"total":%d}' % total
+        await response_cache.store("books", request, content)
+        return Response(content=content, media_type="application/json")
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b'{"items":[' + first + b"," + _serialize_batch(second)
+        async for books in batches:
+            yield b"," + _serialize_batch(books)
+        yield b'],"total":%d}' % total
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @router.post("/", response_model=book.Book, status_code=201)
 async def create_book(
     book_in: book.BookCreate,
@@ -25,14 +79,13 @@ async def create_book(
     Raises:
         HTTPException: If there is an error creating the book.
     """
-    try:
-        book = await crud_book.create(db=db, obj_in=book_in)
-        return book
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    db_book = await crud_book.create(db=db, obj_in=book_in)
+    await response_cache.clear("books")
+    return json_response(db_book, book.Book, status_code=201)
 
-@router.get("/", response_model=List[book.Book])
+@router.get("/", response_model=book.BookPage)
 async def read_books(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
     db: AsyncSession = Depends(get_session)
@@ -41,24 +94,26 @@ async def read_books(
     Retrieve a list of books.
 
     Args:
+        request (Request): The incoming request, used as the cache key.
         skip (int): Number of items to skip. Defaults to 0.
         limit (int): Maximum number of items to return. Defaults to 10.
         db (AsyncSession): The database session dependency.
 
     Returns:
-        List[book.Book]: A list of books.
+        book.BookPage: A page of books with the total number of books.
 
     Raises:
         HTTPException: If there is an error retrieving the books.
     """
-    try:
-        books = await crud_book.get_multi(db=db, skip=skip, limit=limit)
-        return books
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("books", request)
+    if cached:
+        return cached
+    batches, total = await crud_book.get_multi(db=db, skip=skip, limit=limit)
+    return await _page_response(request, batches, total)
 
 @router.get("/{book_id}", response_model=book.Book)
 async def read_book(
+    request: Request,
     book_id: int,
     db: AsyncSession = Depends(get_session)
 ):
@@ -66,6 +121,7 @@ async def read_book(
     Retrieve a specific book by ID.
 
     Args:
+        request (Request): The incoming request, used as the cache key.
         book_id (int): The ID of the book to retrieve.
         db (AsyncSession): The database session dependency.
 
@@ -75,13 +131,13 @@ async def read_book(
     Raises:
         HTTPException: If the book is not found or if there is an error retrieving it.
     """
-    try:
-        book = await crud_book.get(db=db, id=book_id)
-        if not book:
-            raise HTTPException(status_code=404, detail="Book not found")
-        return book
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("books", request)
+    if cached:
+        return cached
+    db_book = await crud_book.get(db=db, id=book_id)
+    if not db_book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return await response_cache.set("books", request, db_book, book.Book)
 
 @router.put("/{book_id}", response_model=book.Book)
 async def update_book(
@@ -103,20 +159,17 @@ async def update_book(
     Raises:
         HTTPException: If the book is not found or if there is an error updating it.
     """
-    try:
-        book = await crud_book.get(db=db, id=book_id)
-        if not book:
-            raise HTTPException(status_code=404, detail="Book not found")
-        book = await crud_book.update(db=db, db_obj=book, obj_in=book_in)
-        return book
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    db_book = await crud_book.update(db=db, id=book_id, obj_in=book_in)
+    if not db_book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    await response_cache.clear("books")
+    return json_response(db_book, book.Book)
 
-@router.delete("/{book_id}", response_model=book.Book)
+@router.delete("/{book_id}", status_code=204)
 async def delete_book(
     book_id: int,
     db: AsyncSession = Depends(get_session)
-):
+) -> None:
     """
     Delete a book by ID.
 
@@ -124,53 +177,54 @@ async def delete_book(
         book_id (int): The ID of the book to delete.
         db (AsyncSession): The database session dependency.
 
-    Returns:
-        book.Book: The deleted book.
-
     Raises:
         HTTPException: If the book is not found or if there is an error deleting it.
     """
-    try:
-        book = await crud_book.get(db=db, id=book_id)
-        if not book:
-            raise HTTPException(status_code=404, detail="Book not found")
-        book = await crud_book.remove(db=db, id=book_id)
-        return book
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    deleted_id = await crud_book.remove(db=db, id=book_id)
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    await response_cache.clear("books")
 
-@router.get("/filter/", response_model=List[book.Book])
+@router.get("/filter/", response_model=book.BookPage)
 async def filter_books(
+    request: Request,
     author: Optional[str] = None,
     genre: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
+    skip: int = 0,
+    limit: int = 10,
     db: AsyncSession = Depends(get_session)
 ):
     """
     Filter books based on optional query parameters.
 
     Args:
-        author (Optional[str]): Filter books by author name.
-        genre (Optional[str]): Filter books by genre.
+        request (Request): The incoming request, used as the cache key.
+        author (Optional[str]): Filter books by author first or last name, case-insensitively.
+        genre (Optional[str]): Filter books by genre name, case-insensitively.
         min_price (Optional[float]): Filter books by minimum price.
         max_price (Optional[float]): Filter books by maximum price.
+        skip (int): Number of items to skip. Defaults to 0.
+        limit (int): Maximum number of items to return. Defaults to 10.
         db (AsyncSession): The database session dependency.
 
     Returns:
-        List[book.Book]: A list of filtered books.
+        book.BookPage: A page of filtered books with the total number of matches.
 
     Raises:
         HTTPException: If there is an error filtering the books.
     """
-    try:
-        books = await crud_book.filter(
-            db=db,
-            author=author,
-            genre=genre,
-            min_price=min_price,
-            max_price=max_price
-        )
-        return books
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("books", request)
+    if cached:
+        return cached
+    batches, total = await crud_book.filter(
+        db=db,
+        author=author,
+        genre=genre,
+        min_price=min_price,
+        max_price=max_price,
+        skip=skip,
+        limit=limit
+    )
+    return await _page_response(request, batches, total)
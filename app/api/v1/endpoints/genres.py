@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.cache import response_cache
+from app.core.responses import json_response
 from app.crud.crud_genre import crud_genre
 from app.schemas import genre
 from app.core.init_db import get_session
@@ -25,15 +27,14 @@ async def create_genre(
     Raises:
         HTTPException: If there is an error creating the genre.
     """
-    try:
-        genre = await crud_genre.create(db=db, obj_in=genre_in)
-        return genre
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    db_genre = await crud_genre.create(db=db, obj_in=genre_in)
+    await response_cache.clear("genres")
+    return json_response(db_genre, genre.Genre, status_code=201)
 
 @router.get("/", response_model=List[genre.Genre])
 async def read_genres(
-    skip: int = 0,
+    request: Request,
+    after_id: Optional[int] = None,
     limit: int = 10,
     db: AsyncSession = Depends(get_session)
 ):
@@ -41,7 +42,8 @@ async def read_genres(
     Retrieve a list of genres.
 
     Args:
-        skip (int): Number of items to skip. Defaults to 0.
+        request (Request): The incoming request, used as the cache key.
+        after_id (Optional[int]): Return only items with an ID greater than this, i.e. the last ID of the previous page. Defaults to None.
         limit (int): Maximum number of items to return. Defaults to 10.
         db (AsyncSession): The database session dependency.
 
@@ -51,14 +53,15 @@ async def read_genres(
     Raises:
         HTTPException: If there is an error retrieving the genres.
     """
-    try:
-        genres = await crud_genre.get_multi(db=db, skip=skip, limit=limit)
-        return genres
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("genres", request)
+    if cached:
+        return cached
+    genres = await crud_genre.get_multi(db=db, after_id=after_id, limit=limit)
+    return await response_cache.set("genres", request, genres, List[genre.Genre])
 
 @router.get("/{genre_id}", response_model=genre.Genre)
 async def read_genre(
+    request: Request,
     genre_id: int,
     db: AsyncSession = Depends(get_session)
 ):
@@ -66,6 +69,7 @@ async def read_genre(
     Retrieve a specific genre by ID.
 
     Args:
+        request (Request): The incoming request, used as the cache key.
         genre_id (int): The ID of the genre to retrieve.
         db (AsyncSession): The database session dependency.
 
@@ -75,13 +79,13 @@ async def read_genre(
     Raises:
         HTTPException: If the genre is not found or if there is an error retrieving it.
     """
-    try:
-        genre = await crud_genre.get(db=db, id=genre_id)
-        if not genre:
-            raise HTTPException(status_code=404, detail="Genre not found")
-        return genre
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("genres", request)
+    if cached:
+        return cached
+    db_genre = await crud_genre.get(db=db, id=genre_id)
+    if not db_genre:
+        raise HTTPException(status_code=404, detail="Genre not found")
+    return await response_cache.set("genres", request, db_genre, genre.Genre)
 
 @router.put("/{genre_id}", response_model=genre.Genre)
 async def update_genre(
@@ -103,20 +107,17 @@ async def update_genre(
     Raises:
         HTTPException: If the genre is not found or if there is an error updating it.
     """
-    try:
-        genre = await crud_genre.get(db=db, id=genre_id)
-        if not genre:
-            raise HTTPException(status_code=404, detail="Genre not found")
-        genre = await crud_genre.update(db=db, db_obj=genre, obj_in=genre_in)
-        return genre
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@router.delete("/{genre_id}", response_model=genre.Genre)
+    db_genre = await crud_genre.update(db=db, id=genre_id, obj_in=genre_in)
+    if not db_genre:
+        raise HTTPException(status_code=404, detail="Genre not found")
+    await response_cache.clear("genres", "books")
+    return json_response(db_genre, genre.Genre)
+
+@router.delete("/{genre_id}", status_code=204)
 async def delete_genre(
     genre_id: int,
     db: AsyncSession = Depends(get_session)
-):
+) -> None:
     """
     Delete a genre by ID.
 
@@ -124,17 +125,10 @@ async def delete_genre(
         genre_id (int): The ID of the genre to delete.
         db (AsyncSession): The database session dependency.
 
-    Returns:
-        genre.Genre: The deleted genre.
-
     Raises:
         HTTPException: If the genre is not found or if there is an error deleting it.
     """
-    try:
-        genre = await crud_genre.get(db=db, id=genre_id)
-        if not genre:
-            raise HTTPException(status_code=404, detail="Genre not found")
-        genre = await crud_genre.remove(db=db, id=genre_id)
-        return genre
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    deleted_id = await crud_genre.remove(db=db, id=genre_id)
+    if deleted_id is None:
+        raise HTTPException(status_code=404, detail="Genre not found")
+    await response_cache.clear("genres", "books")
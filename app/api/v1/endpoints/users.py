@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
+from app.core.cache import response_cache
+from app.core.responses import json_response
 from app.crud.crud_user import crud_user
 from app.schemas import user
 from app.core.init_db import get_session
@@ -25,15 +27,14 @@ async def create_user(
     Raises:
         HTTPException: If the user could not be created.
     """
-    try:
-        user = await crud_user.create(db=db, obj_in=user_in)
-        return user
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    db_user = await crud_user.create(db=db, obj_in=user_in)
+    await response_cache.clear("users")
+    return json_response(db_user, user.User, status_code=201)
 
 @router.get("/", response_model=List[user.User])
 async def read_users(
-    skip: int = 0,
+    request: Request,
+    after_id: Optional[int] = None,
     limit: int = 10,
     db: AsyncSession = Depends(get_session)
 ):
@@ -41,7 +42,8 @@ async def read_users(
     Retrieve a list of users.
 
     Args:
-        skip (int): The number of items to skip. Defaults to 0.
+        request (Request): The incoming request, used as the cache key.
+        after_id (Optional[int]): Return only items with an ID greater than this, i.e. the last ID of the previous page. Defaults to None.
         limit (int): The maximum number of items to return. Defaults to 10.
         db (AsyncSession): The database session dependency.
 
@@ -51,14 +53,15 @@ async def read_users(
     Raises:
         HTTPException: If an error occurs while retrieving users.
     """
-    try:
-        users = await crud_user.get_multi(db=db, skip=skip, limit=limit)
-        return users
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    cached = await response_cache.get("users", request)
+    if cached:
+        return cached
+    users = await crud_user.get_multi(db=db, after_id=after_id, limit=limit)
+    return await response_cache.set("users", request, users, List[user.User])
 
 @router.get("/{user_id}", response_model=user.User)
 async def read_user(
+    request: Request,
     user_id: int,
     db: AsyncSession = Depends(get_session)
 ):
@@ -66,6 +69,7 @@ async def read_user(
     Retrieve a specific user by ID.
 
     Args:
+        request (Request): The incoming request, used as the cache key.
         user_id (int): The ID of the user to retrieve.
         db (AsyncSession): The database session dependency.
 
@@ -75,10 +79,13 @@ async def read_user(
     Raises:
         HTTPException: If the user is not found.
     """
-    user = await crud_user.get(db=db, id=user_id)
-    if not user:
+    cached = await response_cache.get("users", request)
+    if cached:
+        return cached
+    db_user = await crud_user.get(db=db, id=user_id)
+    if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return await response_cache.set("users", request, db_user, user.User)
 
 @router.put("/{user_id}", response_model=user.User)
 async def update_user(
@@ -100,20 +107,17 @@ async def update_user(
     Raises:
         HTTPException: If the user is not found or if an error occurs during the update.
     """
-    user = await crud_user.get(db=db, id=user_id)
-    if not user:
+    db_user = await crud_user.update(db=db, id=user_id, obj_in=user_in)
+    if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
-    try:
-        user = await crud_user.update(db=db, db_obj=user, obj_in=user_in)
-        return user
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    await response_cache.clear("users", "books")
+    return json_response(db_user, user.User)
 
-@router.delete("/{user_id}", response_model=user.User)
+@router.delete("/{user_id}", status_code=204)
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_session)
-):
+) -> None:
     """
     Delete a user by ID.
 
@@ -121,17 +125,10 @@ async def delete_user(
         user_id (int): The ID of the user to delete.
         db (AsyncSession): The database session dependency.
 
-    Returns:
-        user.User: The deleted user.
-
     Raises:
         HTTPException: If the user is not found or if an error occurs during deletion.
     """
-    user = await crud_user.get(db=db, id=user_id)
-    if not user:
+    deleted_id = await crud_user.remove(db=db, id=user_id)
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="User not found")
-    try:
-        user = await crud_user.remove(db=db, id=user_id)
-        return user
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    await response_cache.clear("users", "books")
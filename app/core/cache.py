@@ -0,0 +1,99 @@
+from typing import Any, Optional
+from fastapi import Request, Response
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.responses import json_response
+
+
+class ResponseCache:
+    """
+    Redis-backed cache for serialized JSON responses of read endpoints.
+
+    Each namespace (e.g. "books") is stored as one Redis hash keyed by the request
+    path and query string, so a whole namespace is invalidated with a single DEL
+    after a write. The hash expires `expire` seconds after its first entry was
+    written, which bounds staleness for changes made outside the API. Redis errors
+    are ignored so that the API keeps working without the cache.
+    """
+
+    def __init__(self, url: str, expire: int) -> None:
+        self.redis = aioredis.from_url(url)
+        self.expire = expire
+
+    @staticmethod
+    def _key(namespace: str) -> str:
+        return f"cache:{namespace}"
+
+    @staticmethod
+    def _field(request: Request) -> str:
+        return f"{request.url.path}?{request.url.query}"
+
+    async def get(self, namespace: str, request: Request) -> Optional[Response]:
+        """
+        Return the cached response for a request, if there is one.
+
+        Args:
+            namespace (str): The cache namespace of the endpoint.
+            request (Request): The incoming request.
+
+        Returns:
+            Optional[Response]: The cached JSON response, or None on a cache miss.
+        """
+        try:
+            content = await self.redis.hget(self._key(namespace), self._field(request))
+        except RedisError:
+            return None
+        if content is None:
+            return None
+        return Response(content=content, media_type="application/json")
+
+    async def set(self, namespace: str, request: Request, content: Any, schema: Any) -> Response:
+        """
+        Serialize a response with its schema, cache it and return it.
+
+        Args:
+            namespace (str): The cache namespace of the endpoint.
+            request (Request): The incoming request.
+            content (Any): The data to return, e.g. ORM objects.
+            schema (Any): The response schema used to validate and serialize `content`.
+
+        Returns:
+            Response: The serialized JSON response.
+        """
+        response = json_response(content, schema)
+        await self.store(namespace, request, response.body)
+        return response
+
+    async def store(self, namespace: str, request: Request, body: bytes) -> None:
+        """
+        Cache an already serialized JSON response body for a request.
+
+        Args:
+            namespace (str): The cache namespace of the endpoint.
+            request (Request): The incoming request.
+            body (bytes): The serialized response body.
+        """
+        key = self._key(namespace)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, self._field(request), body)
+                pipe.expire(key, self.expire, nx=True)
+                await pipe.execute()
+        except RedisError:
+            pass
+
+    async def clear(self, *namespaces: str) -> None:
+        """
+        Invalidate every cached response in the given namespaces.
+
+        Args:
+            namespaces (str): The cache namespaces to clear.
+        """
+        try:
+            await self.redis.delete(*(self._key(namespace) for namespace in namespaces))
+        except RedisError:
+            pass
+
+
+response_cache = ResponseCache(settings.CACHE_REDIS_URL, settings.CACHE_EXPIRE)
@@ -13,13 +13,17 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
-    broker_connection_retry_on_startup=True
+    broker_connection_retry_on_startup=True,
+    # Booking expiry is a short I/O-bound coroutine; it runs on its own queue served
+    # by a single-process worker that keeps one event loop and connection pool.
+    task_routes={'check_bookings': {'queue': 'expiry'}}
 )
 
 celery_app.conf.beat_schedule = {
     'check-bookings-every-minute': {
         'task': 'check_bookings',
         'schedule': crontab(minute='*'),
+        'kwargs': {'batch_size': 500},
     },
 }
 
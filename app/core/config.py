@@ -1,4 +1,5 @@
-import os
+from functools import lru_cache
+from pydantic import computed_field
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -10,12 +11,42 @@ class Settings(BaseSettings):
     """
     
     API_V1_STR: str = "/api/v1"
-    POSTGRES_SERVER: str = os.getenv("POSTGRES_SERVER", "db")
-    POSTGRES_USER: str = os.getenv("POSTGRES_USER", "postgres")
-    POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "postgres")
-    POSTGRES_DB: str = os.getenv("POSTGRES_DB", "book_catalog")
-    DATABASE_URL: str = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}/{POSTGRES_DB}"
-    CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
-    CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/0")
+    POSTGRES_SERVER: str = "db"
+    POSTGRES_USER: str = "postgres"
+    POSTGRES_PASSWORD: str = "postgres"
+    POSTGRES_DB: str = "book_catalog"
+    CELERY_BROKER_URL: str = "redis://redis:6379/0"
+    CELERY_RESULT_BACKEND: str = "redis://redis:6379/0"
+    CACHE_REDIS_URL: str = "redis://redis:6379/1"
+    CACHE_EXPIRE: int = 30
+    TIMEZONE: str = "Europe/Moscow"
+    DEBUG: bool = False
+    LOG_SQL: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 1024
+    DB_APPLICATION_NAME: str = "book_catalog"
+    DB_TCP_KEEPALIVES_IDLE: int = 60
+    DB_TCP_KEEPALIVES_INTERVAL: int = 10
+    DB_TCP_KEEPALIVES_COUNT: int = 5
 
-settings = Settings()
+    @computed_field
+    @property
+    def DATABASE_URL(self) -> str:
+        """
+        The asyncpg database URL built from the `POSTGRES_*` settings.
+        """
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the application settings, constructed once per process.
+    """
+    return Settings()
+
+settings = get_settings()
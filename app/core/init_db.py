@@ -1,20 +1,36 @@
-from typing import AsyncGenerator
+from fastapi import Request
 from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, future=True, echo=True)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    future=True,
+    echo=settings.LOG_SQL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # Set both cache sizes to 0 when connecting through PgBouncer in transaction mode.
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "application_name": settings.DB_APPLICATION_NAME,
+            "tcp_keepalives_idle": str(settings.DB_TCP_KEEPALIVES_IDLE),
+            "tcp_keepalives_interval": str(settings.DB_TCP_KEEPALIVES_INTERVAL),
+            "tcp_keepalives_count": str(settings.DB_TCP_KEEPALIVES_COUNT),
+        },
+    }
+)
 
-async_session = sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
+async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 Base = declarative_base()
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
-        yield session
+async def get_session(request: Request) -> AsyncSession:
+    return request.state.db
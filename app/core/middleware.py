@@ -0,0 +1,96 @@
+import hashlib
+from typing import List, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.init_db import async_session
+
+
+class SessionMiddleware:
+    """
+    ASGI middleware that opens one database session per HTTP request.
+
+    The session is stored on the request state as `request.state.db` and is
+    closed once the response has been sent, so endpoints can resolve it with a
+    plain `async def` dependency instead of a generator dependency.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with async_session() as session:
+            scope.setdefault("state", {})["db"] = session
+            await self.app(scope, receive, send)
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware that adds an `ETag` header to GET responses and answers
+    conditional requests with `304 Not Modified`.
+
+    The tag is a BLAKE2b digest of the response body, so a client that already
+    holds the current representation does not receive the payload again.
+    Responses without a `Content-Length` (streamed responses) and non-200
+    responses are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Optional[Message] = None
+        body: List[bytes] = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] == 200 and "content-length" in headers and "etag" not in headers:
+                    start_message = message
+                    return
+            if start_message is None:
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(body)
+            etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start_message)
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_with_etag)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an `If-None-Match` header value against an ETag using weak comparison.
+
+    Args:
+        if_none_match (str): The raw `If-None-Match` header value.
+        etag (str): The current (strong) ETag of the resource.
+
+    Returns:
+        bool: True if the client's cached representation is still current.
+    """
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
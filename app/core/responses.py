@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Any
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache
+def _type_adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def json_response(content: Any, schema: Any, status_code: int = 200) -> Response:
+    """
+    Serialize data with its response schema and wrap it in a JSON response.
+
+    Returning a `Response` bypasses FastAPI's response model handling, which would
+    validate the data, convert it to Python primitives and only then encode them.
+    Here the ORM objects are read once and encoded straight to JSON by
+    pydantic-core. Routes keep `response_model=` for the OpenAPI schema.
+
+    Args:
+        content (Any): The data to return, e.g. ORM objects.
+        schema (Any): The response schema used to read and serialize `content`.
+        status_code (int): The HTTP status code of the response. Defaults to 200.
+
+    Returns:
+        Response: The serialized JSON response.
+    """
+    adapter = _type_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return Response(content=body, status_code=status_code, media_type="application/json")
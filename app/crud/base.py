@@ -0,0 +1,149 @@
+from typing import Generic, List, Optional, Type, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.init_db import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    Generic CRUD operations shared by the model-specific CRUD classes.
+
+    Model-specific classes subclass it and override only the operations that
+    differ, e.g. `create` with extra checks or `_before_remove` to clean up
+    dependent rows.
+
+    Attributes:
+        model (Type[ModelType]): The SQLAlchemy model the operations act on.
+    """
+    __slots__ = ("model",)
+
+    def __init__(self, model: Type[ModelType]) -> None:
+        self.model = model
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """
+        Create a new entry in the database.
+
+        The generated ID is returned by the INSERT itself and the session does not
+        expire objects on commit, so the new object is not refreshed afterwards.
+
+        Args:
+            db (AsyncSession): The database session.
+            obj_in (CreateSchemaType): The data to be created.
+
+        Returns:
+            ModelType: The created object.
+
+        Raises:
+            SQLAlchemyError: If there's a database error during the operation.
+        """
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        await db.commit()
+        return db_obj
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """
+        Retrieve an object by its ID.
+
+        Args:
+            db (AsyncSession): The database session.
+            id (int): The ID of the object to retrieve.
+
+        Returns:
+            Optional[ModelType]: The retrieved object, or None if not found.
+
+        Raises:
+            SQLAlchemyError: If there's a database error during the operation.
+        """
+        return await db.get(self.model, id)
+
+    async def get_multi(self, db: AsyncSession, *, after_id: Optional[int] = None, limit: int = 10) -> List[ModelType]:
+        """
+        Retrieve multiple objects with keyset pagination.
+
+        Pages are ordered by ID and continue after the last ID of the previous page,
+        so each page is an index range scan regardless of how deep it is.
+
+        Args:
+            db (AsyncSession): The database session.
+            after_id (Optional[int]): Return only records with an ID greater than this (default is None).
+            limit (int): Maximum number of records to return (default is 10).
+
+        Returns:
+            List[ModelType]: A list of objects.
+
+        Raises:
+            SQLAlchemyError: If there's a database error during the operation.
+        """
+        query = select(self.model).order_by(self.model.id).limit(limit)
+        if after_id is not None:
+            query = query.where(self.model.id > after_id)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def update(self, db: AsyncSession, *, id: int, obj_in: UpdateSchemaType) -> Optional[ModelType]:
+        """
+        Update an existing object with a single UPDATE ... RETURNING.
+
+        Args:
+            db (AsyncSession): The database session.
+            id (int): The ID of the object to update.
+            obj_in (UpdateSchemaType): The new data to update the object with.
+
+        Returns:
+            Optional[ModelType]: The updated object, or None if not found.
+
+        Raises:
+            SQLAlchemyError: If there's a database error during the operation.
+        """
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**obj_in.model_dump(exclude_unset=True))
+            .returning(self.model)
+        )
+        db_obj = result.scalars().first()
+        if not db_obj:
+            await db.rollback()
+            return None
+        await db.commit()
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[int]:
+        """
+        Remove an object with a single DELETE ... RETURNING.
+
+        Args:
+            db (AsyncSession): The database session.
+            id (int): The ID of the object to remove.
+
+        Returns:
+            Optional[int]: The ID of the removed object, or None if not found.
+
+        Raises:
+            SQLAlchemyError: If there's a database error during the operation.
+        """
+        await self._before_remove(db, id)
+        result = await db.execute(delete(self.model).where(self.model.id == id).returning(self.model.id))
+        deleted_id = result.scalar()
+        if deleted_id is None:
+            await db.rollback()
+            return None
+        await db.commit()
+        return deleted_id
+
+    async def _before_remove(self, db: AsyncSession, id: int) -> None:
+        """
+        Hook run in the same transaction before an object is deleted.
+
+        Args:
+            db (AsyncSession): The database session.
+            id (int): The ID of the object being removed.
+        """
@@ -1,20 +1,73 @@
-from typing import List, Optional
-from sqlalchemy import or_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import bindparam, delete, func, insert, lambda_stmt, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.book import Book
+from app.models.book import Book, book_genre_association
 from app.models.user import User
 from app.models.genre import Genre
 from app.schemas.book import BookCreate, BookUpdate
 
+_GET_AUTHOR_ID = lambda_stmt(lambda: select(User.id).filter(User.id == bindparam("id")))
+_STREAM_BATCH_SIZE = 100
+
 class CRUDBook:
     """
     A class to handle CRUD operations for the Book model.
     """
 
+    async def _check_author(self, db: AsyncSession, author_id: int) -> None:
+        """
+        Check that the author exists.
+
+        Args:
+            db (AsyncSession): The database session.
+            author_id (int): The ID of the author to check.
+
+        Raises:
+            ValueError: If the author is not found.
+        """
+        result = await db.execute(_GET_AUTHOR_ID, {"id": author_id})
+        if result.scalar() is None:
+            raise ValueError("Author not found")
+
+    async def _check_author_and_get_genres(self, db: AsyncSession, author_id: int, genre_ids: List[int]) -> List[Genre]:
+        """
+        Check the author and load the genres in a single query.
+
+        The requested genres are outer joined to the author row, so a missing author
+        yields no rows and an author with no matching genres yields a single row
+        without a genre. Both lookups run on the request session, so a book write
+        never holds a second pooled connection.
+
+        Args:
+            db (AsyncSession): The database session.
+            author_id (int): The ID of the author to check.
+            genre_ids (List[int]): The IDs of the genres to load.
+
+        Returns:
+            List[Genre]: The genre objects matching the requested IDs.
+
+        Raises:
+            ValueError: If the author or any genres are not found.
+        """
+        result = await db.execute(
+            select(User.id, Genre)
+            .outerjoin(Genre, Genre.id.in_(genre_ids))
+            .filter(User.id == author_id)
+        )
+        rows = result.all()
+        if not rows:
+            raise ValueError("Author not found")
+        genres = [genre for _, genre in rows if genre is not None]
+        missing = set(genre_ids) - {genre.id for genre in genres}
+        if missing:
+            raise ValueError(f"Genres with ids {sorted(missing)} not found")
+        return genres
+
     async def create(self, db: AsyncSession, *, obj_in: BookCreate) -> Book:
         """
         Create a new book entry in the database.
@@ -30,34 +83,18 @@ class CRUDBook:
             ValueError: If the author or any genres are not found.
             SQLAlchemyError: If there's an error while creating the book.
         """
-        try:
-            author = await db.execute(select(User).filter(User.id == obj_in.author_id))
-            author_obj = author.scalars().first()
-            if not author_obj:
-                raise ValueError("Author not found")
-
-            genres = []
-            if obj_in.genres:
-                for genre_id in obj_in.genres:
-                    genre = await db.execute(select(Genre).filter(Genre.id == genre_id))
-                    genre_obj = genre.scalars().first()
-                    if genre_obj:
-                        genres.append(genre_obj)
-                    else:
-                        raise ValueError(f"Genre with id {genre_id} not found")
-
-            db_obj = Book(
-                title=obj_in.title,
-                price=obj_in.price,
-                pages=obj_in.pages,
-                author=author_obj,
-                genres=genres
-            )
-            db.add(db_obj)
-            await db.commit()
-            return db_obj
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error creating book: {str(e)}")
+        genres = await self._check_author_and_get_genres(db, obj_in.author_id, obj_in.genres or [])
+
+        db_obj = Book(
+            title=obj_in.title,
+            price=obj_in.price,
+            pages=obj_in.pages,
+            author_id=obj_in.author_id,
+            genres=genres
+        )
+        db.add(db_obj)
+        await db.commit()
+        return db_obj
 
     async def get(self, db: AsyncSession, id: int) -> Optional[Book]:
         """
@@ -73,16 +110,53 @@ class CRUDBook:
         Raises:
             SQLAlchemyError: If there's an error while retrieving the book.
         """
-        try:
-            result = await db.execute(select(Book).options(selectinload(Book.genres)).filter(Book.id == id))
-            book = result.scalars().first()
-            return book
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error retrieving book: {str(e)}")
+        return await db.get(Book, id, options=[selectinload(Book.genres)])
+
+    async def _paginate(self, db: AsyncSession, query: Select, *, skip: int, limit: int) -> Tuple[AsyncIterator[List[Book]], int]:
+        """
+        Stream one page of a book query together with the total number of matches.
+
+        The total is computed with COUNT(*) OVER() in the same SELECT, so a page and
+        its total cost a single round trip. Only an empty page past the last row or of
+        zero size needs a separate count. The first batch is fetched before returning, so errors are
+        raised here rather than while the response is being sent.
 
-    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 10) -> List[Book]:
+        Args:
+            db (AsyncSession): The database session.
+            query (Select): The book query to paginate.
+            skip (int): Number of records to skip.
+            limit (int): Maximum number of records to return.
+
+        Returns:
+            Tuple[AsyncIterator[List[Book]], int]: An iterator over batches of the books
+            on the requested page and the total number of matches.
+        """
+        result = await db.stream(
+            query.add_columns(func.count().over().label("total"))
+            .order_by(Book.id)
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        rows = await result.fetchmany(_STREAM_BATCH_SIZE)
+        if rows:
+            total = rows[0][1]
+        elif skip or limit <= 0:
+            total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        else:
+            total = 0
+
+        async def batches() -> AsyncIterator[List[Book]]:
+            chunk = rows
+            while chunk:
+                yield [row[0] for row in chunk]
+                chunk = await result.fetchmany(_STREAM_BATCH_SIZE)
+
+        return batches(), total
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 10) -> Tuple[AsyncIterator[List[Book]], int]:
         """
-        Retrieve multiple books with pagination.
+        Retrieve multiple books with pagination, streamed in batches.
 
         Args:
             db (AsyncSession): The database session.
@@ -90,133 +164,133 @@ class CRUDBook:
             limit (int): Maximum number of records to return (default is 10).
 
         Returns:
-            List[Book]: A list of book objects.
+            Tuple[AsyncIterator[List[Book]], int]: An iterator over batches of book objects
+            and the total number of books.
 
         Raises:
             SQLAlchemyError: If there's an error while retrieving books.
         """
-        try:
-            result = await db.execute(select(Book).offset(skip).limit(limit).options(selectinload(Book.genres)))
-            books = result.scalars().all()
-            return books
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error retrieving books: {str(e)}")
+        query = select(Book).options(selectinload(Book.genres))
+        return await self._paginate(db, query, skip=skip, limit=limit)
 
-    async def update(self, db: AsyncSession, *, db_obj: Book, obj_in: BookUpdate) -> Book:
+    async def update(self, db: AsyncSession, *, id: int, obj_in: BookUpdate) -> Optional[Book]:
         """
         Update an existing book in the database.
 
+        The book row is updated with UPDATE ... RETURNING, so the book does not
+        have to be loaded before it is modified.
+
         Args:
             db (AsyncSession): The database session.
-            db_obj (Book): The book object to be updated.
+            id (int): The ID of the book to update.
             obj_in (BookUpdate): The new data to update the book with.
 
         Returns:
-            Book: The updated book object.
+            Optional[Book]: The updated book object, or None if not found.
 
         Raises:
             ValueError: If the author or any genres are not found.
             SQLAlchemyError: If there's an error while updating the book.
         """
-        try:
-            if obj_in.author_id is not None:
-                author = await db.execute(select(User).filter(User.id == obj_in.author_id))
-                author_obj = author.scalars().first()
-                if not author_obj:
-                    raise ValueError("Author not found")
-                db_obj.author = author_obj
-
-            if obj_in.genres is not None:
-                genres = []
-                for genre_id in obj_in.genres:
-                    genre = await db.execute(select(Genre).filter(Genre.id == genre_id))
-                    genre_obj = genre.scalars().first()
-                    if genre_obj:
-                        genres.append(genre_obj)
-                    else:
-                        raise ValueError(f"Genre with id {genre_id} not found")
-                db_obj.genres = genres
-
-            if obj_in.title is not None:
-                db_obj.title = obj_in.title
-            if obj_in.price is not None:
-                db_obj.price = obj_in.price
-            if obj_in.pages is not None:
-                db_obj.pages = obj_in.pages
-
-            db.add(db_obj)
-            await db.commit()
-            return db_obj
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error updating book: {str(e)}")
-
-    async def remove(self, db: AsyncSession, *, id: int) -> Book:
+        genres = None
+        if obj_in.genres is not None:
+            genres = await self._check_author_and_get_genres(db, obj_in.author_id, obj_in.genres)
+        elif obj_in.author_id is not None:
+            await self._check_author(db, obj_in.author_id)
+
+        values = {
+            field: value
+            for field, value in obj_in.model_dump(exclude={"genres"}).items()
+            if value is not None
+        }
+        result = await db.execute(update(Book).where(Book.id == id).values(**values).returning(Book))
+        db_obj = result.scalars().first()
+        if not db_obj:
+            await db.rollback()
+            return None
+
+        if genres is not None:
+            await db.execute(delete(book_genre_association).where(book_genre_association.c.book_id == id))
+            if genres:
+                await db.execute(
+                    insert(book_genre_association),
+                    [{"book_id": id, "genre_id": genre.id} for genre in genres]
+                )
+            set_committed_value(db_obj, "genres", genres)
+        else:
+            await db.refresh(db_obj, ["genres"])
+
+        await db.commit()
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[int]:
         """
         Remove a book from the database.
 
+        The genre links and the book row are deleted with plain DELETE statements,
+        without loading the book first.
+
         Args:
             db (AsyncSession): The database session.
             id (int): The ID of the book to remove.
 
         Returns:
-            Book: The removed book object.
+            Optional[int]: The ID of the removed book, or None if not found.
 
         Raises:
-            ValueError: If the book is not found.
             SQLAlchemyError: If there's an error while deleting the book.
         """
-        try:
-            result = await db.execute(select(Book).filter(Book.id == id))
-            db_obj = result.scalars().first()
-            if not db_obj:
-                raise ValueError("Book not found")
-            await db.delete(db_obj)
-            await db.commit()
-            return db_obj
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error deleting book: {str(e)}")
-
-    async def filter(self, db: AsyncSession, *, author: Optional[str] = None, genre: Optional[str] = None, min_price: Optional[float] = None, max_price: Optional[float] = None) -> List[Book]:
+        await db.execute(delete(book_genre_association).where(book_genre_association.c.book_id == id))
+        result = await db.execute(delete(Book).where(Book.id == id).returning(Book.id))
+        deleted_id = result.scalar()
+        if deleted_id is None:
+            await db.rollback()
+            return None
+        await db.commit()
+        return deleted_id
+
+    async def filter(self, db: AsyncSession, *, author: Optional[str] = None, genre: Optional[str] = None, min_price: Optional[float] = None, max_price: Optional[float] = None, skip: int = 0, limit: int = 10) -> Tuple[AsyncIterator[List[Book]], int]:
         """
-        Filter books based on various criteria.
+        Filter books based on various criteria, streaming the matching page in batches.
 
         Args:
             db (AsyncSession): The database session.
-            author (Optional[str]): Filter books by author name.
-            genre (Optional[str]): Filter books by genre name.
+            author (Optional[str]): Filter books by author first or last name, case-insensitively.
+            genre (Optional[str]): Filter books by genre name, case-insensitively.
             min_price (Optional[float]): Filter books with price greater than or equal to this value.
             max_price (Optional[float]): Filter books with price less than or equal to this value.
+            skip (int): Number of records to skip (default is 0).
+            limit (int): Maximum number of records to return (default is 10).
 
         Returns:
-            List[Book]: A list of books that match the criteria.
+            Tuple[AsyncIterator[List[Book]], int]: An iterator over batches of the books that
+            match the criteria and the total number of matches.
 
         Raises:
             SQLAlchemyError: If there's an error while filtering books.
         """
-        try:
-            query = select(Book).options(selectinload(Book.genres))
+        query = select(Book).options(selectinload(Book.genres))
 
-            if author:
-                query = query.filter(
+        if author:
+            author = author.lower()
+            query = query.filter(
+                Book.author.has(
                     or_(
-                        Book.author.has(first_name=author),
-                        Book.author.has(last_name=author),
-                        Book.author.has(avatar=author)
+                        func.lower(User.first_name) == author,
+                        func.lower(User.last_name) == author
                     )
                 )
+            )
 
-            if genre:
-                query = query.filter(Book.genres.any(name=genre))
+        if genre:
+            query = query.filter(Book.genres.any(func.lower(Genre.name) == genre.lower()))
 
-            if min_price is not None:
-                query = query.filter(Book.price >= min_price)
+        if min_price is not None:
+            query = query.filter(Book.price >= min_price)
 
-            if max_price is not None:
-                query = query.filter(Book.price <= max_price)
+        if max_price is not None:
+            query = query.filter(Book.price <= max_price)
 
-            result = await db.execute(query)
-            return result.scalars().all()
-        except SQLAlchemyError as e:
-            raise ValueError(f"Error filtering books: {str(e)}")
+        return await self._paginate(db, query, skip=skip, limit=limit)
 
 crud_book = CRUDBook()
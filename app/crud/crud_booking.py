@@ -1,253 +1,239 @@
-from typing import List, Optional
-from sqlalchemy import and_, select
+from typing import Optional
+from sqlalchemy import DateTime, Integer, bindparam, exists, func, insert, lambda_stmt, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timezone
+from app.crud.base import CRUDBase
 from app.models.booking import Booking
 from app.models.book import Book
 from app.models.user import User
-from app.schemas.booking import BookingCreate, BookingUpdate
+from app.schemas.booking import BookingBase, BookingCreate, BookingUpdate
+
+# Deactivates one batch of expired bookings; `now` may be NULL to use the database clock.
+_NOW = bindparam("now", type_=DateTime(timezone=True))
+_BATCH_SIZE = bindparam("batch_size", type_=Integer)
+_CANCEL_EXPIRED = lambda_stmt(
+    lambda: update(Booking)
+    .where(
+        Booking.id.in_(
+            select(Booking.id)
+            .where(
+                Booking.active,
+                Booking.end_time < func.coalesce(_NOW, func.now())
+            )
+            .order_by(Booking.end_time)
+            .limit(_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+    )
+    .values(active=False)
+    .execution_options(synchronize_session=False)
+)
+
+def _is_overlap(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error was raised by the booking `no_overlap` exclusion constraint.
+
+    Args:
+        error (IntegrityError): The error raised by the database.
+
+    Returns:
+        bool: True if the error is an overlap between active bookings of the same book.
+    """
+    return getattr(error.orig.__cause__, "constraint_name", None) == "no_overlap"
 
-class CRUDBooking:
+class CRUDBooking(CRUDBase[Booking, BookingCreate, BookingUpdate]):
     """
     A class to handle CRUD operations for the Booking model.
     """
+    __slots__ = ()
 
-    async def create(self, db: AsyncSession, *, obj_in: BookingCreate) -> Optional[Booking]:
+    async def _check_references(self, db: AsyncSession, obj_in: BookingBase) -> None:
         """
-        Create a new booking entry in the database.
+        Check in a single query that the book and user referenced by a booking exist.
 
         Args:
             db (AsyncSession): The database session.
-            obj_in (BookingCreate): The booking data to be created.
-
-        Returns:
-            Optional[Booking]: The created booking object, or None if the booking overlaps with an existing active booking.
+            obj_in (BookingBase): The booking data to check.
 
         Raises:
-            ValueError: If the start time is not before the end time, or if the book or user does not exist.
-            SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
+            ValueError: If the book or user does not exist.
         """
-        try:
-            if obj_in.start_time >= obj_in.end_time:
-                raise ValueError("Start time must be before end time")
-
-            book_query = select(Book).filter(Book.id == obj_in.book_id)
-            book_result = await db.execute(book_query)
-            book = book_result.scalars().first()
-            if not book:
-                raise ValueError("Book with given ID does not exist")
-            
-            user_query = select(User).filter(User.id == obj_in.user_id)
-            user_result = await db.execute(user_query)
-            user = user_result.scalars().first()
-            if not user:
-                raise ValueError("User with given ID does not exist")
-
-            existing_bookings_query = select(Booking).filter(
-                and_(
-                    Booking.book_id == obj_in.book_id,
-                    Booking.end_time > obj_in.start_time,
-                    Booking.start_time < obj_in.end_time,
-                    Booking.active == True
-                )
-            )
-            existing_bookings_result = await db.execute(existing_bookings_query)
-            if existing_bookings_result.scalars().first():
-                return None
-
-            db_obj = Booking(
-                book_id=obj_in.book_id,
-                user_id=obj_in.user_id,
-                start_time=obj_in.start_time,
-                end_time=obj_in.end_time,
-                active=obj_in.active
-            )
-            db.add(db_obj)
-            await db.commit()
-            await db.refresh(db_obj)
-            return db_obj
-        except SQLAlchemyError as e:
-            await db.rollback()
-            raise Exception(f"Database error occurred: {str(e)}")
-        except ValueError as e:
-            await db.rollback()
-            raise Exception(f"Validation error: {str(e)}")
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Unexpected error occurred: {str(e)}")
+        result = await db.execute(
+            select(exists().where(Book.id == obj_in.book_id), exists().where(User.id == obj_in.user_id))
+        )
+        book_exists, user_exists = result.one()
+        if not book_exists:
+            raise ValueError("Book with given ID does not exist")
+        if not user_exists:
+            raise ValueError("User with given ID does not exist")
 
-    async def get(self, db: AsyncSession, id: int) -> Optional[Booking]:
+    async def create(self, db: AsyncSession, *, obj_in: BookingCreate) -> Optional[Booking]:
         """
-        Retrieve a booking by its ID.
+        Create a new booking entry in the database.
+
+        The booking is inserted with a single INSERT ... SELECT that only produces a row
+        if the book and user exist. Overlaps are rejected atomically by the `no_overlap`
+        exclusion constraint. A follow-up query is made only when nothing was inserted,
+        to report which of the book or user is missing.
 
         Args:
             db (AsyncSession): The database session.
-            id (int): The ID of the booking to retrieve.
+            obj_in (BookingCreate): The booking data to be created.
 
         Returns:
-            Optional[Booking]: The retrieved booking object, or None if not found.
+            Optional[Booking]: The created booking object, or None if the booking overlaps with an existing active booking.
 
         Raises:
+            ValueError: If the start time is not before the end time, or if the book or user does not exist.
             SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
         """
+        if obj_in.start_time >= obj_in.end_time:
+            raise ValueError("Start time must be before end time")
+
+        source = select(
+            literal(obj_in.book_id),
+            literal(obj_in.user_id),
+            literal(obj_in.start_time),
+            literal(obj_in.end_time),
+            literal(obj_in.active)
+        ).where(
+            exists().where(Book.id == obj_in.book_id),
+            exists().where(User.id == obj_in.user_id)
+        )
         try:
-            result = await db.execute(select(Booking).filter(Booking.id == id))
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error occurred: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error occurred: {str(e)}")
-
-    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 10) -> List[Booking]:
-        """
-        Retrieve multiple bookings with pagination.
-
-        Args:
-            db (AsyncSession): The database session.
-            skip (int): Number of records to skip (default is 0).
-            limit (int): Maximum number of records to return (default is 10).
+            result = await db.execute(
+                insert(Booking)
+                .from_select(["book_id", "user_id", "start_time", "end_time", "active"], source)
+                .returning(Booking)
+            )
+        except IntegrityError as e:
+            await db.rollback()
+            if not _is_overlap(e):
+                raise
+            return None
+        db_obj = result.scalars().first()
+        if not db_obj:
+            await db.rollback()
+            await self._check_references(db, obj_in)
+            return None
 
-        Returns:
-            List[Booking]: A list of booking objects.
+        await db.commit()
+        return db_obj
 
-        Raises:
-            SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
-        """
-        try:
-            result = await db.execute(select(Booking).offset(skip).limit(limit))
-            return result.scalars().all()
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error occurred: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error occurred: {str(e)}")
-
-    async def update(self, db: AsyncSession, *, db_obj: Booking, obj_in: BookingUpdate) -> Optional[Booking]:
+    async def update(self, db: AsyncSession, *, id: int, obj_in: BookingUpdate) -> Optional[Booking]:
         """
         Update an existing booking in the database.
 
+        As in `create`, the book and user checks are part of the UPDATE statement itself
+        and overlaps are rejected by the `no_overlap` exclusion constraint; the cause is
+        only looked up when no row was updated.
+
         Args:
             db (AsyncSession): The database session.
-            db_obj (Booking): The existing booking object to be updated.
+            id (int): The ID of the booking to update.
             obj_in (BookingUpdate): The new data to update the booking with.
 
         Returns:
-            Optional[Booking]: The updated booking object, or None if the updated booking overlaps with an existing active booking.
+            Optional[Booking]: The updated booking object, or None if not found.
 
         Raises:
-            ValueError: If the start time is not before the end time, or if the book or user does not exist.
+            ValueError: If the start time is not before the end time, if the book or user does not exist,
+                or if the updated booking overlaps with an existing active booking.
             SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
         """
+        if obj_in.start_time >= obj_in.end_time:
+            raise ValueError("Start time must be before end time")
+
         try:
-            if obj_in.start_time and obj_in.end_time and obj_in.start_time >= obj_in.end_time:
-                raise ValueError("Start time must be before end time")
-
-            book_query = select(Book).filter(Book.id == obj_in.book_id)
-            book_result = await db.execute(book_query)
-            book = book_result.scalars().first()
-            if not book:
-                raise ValueError("Book with given ID does not exist")
-
-            user_query = select(User).filter(User.id == obj_in.user_id)
-            user_result = await db.execute(user_query)
-            user = user_result.scalars().first()
-            if not user:
-                raise ValueError("User with given ID does not exist")
-
-            start_time_naive = obj_in.start_time or db_obj.start_time
-            end_time_naive = obj_in.end_time or db_obj.end_time
-
-            if start_time_naive or end_time_naive:
-                existing_bookings_query = select(Booking).filter(
-                    and_(
-                        Booking.book_id == db_obj.book_id,
-                        Booking.id != db_obj.id,
-                        Booking.end_time > start_time_naive,
-                        Booking.start_time < end_time_naive,
-                        Booking.active == True
-                    )
+            result = await db.execute(
+                update(Booking)
+                .where(
+                    Booking.id == id,
+                    exists().where(Book.id == obj_in.book_id),
+                    exists().where(User.id == obj_in.user_id)
                 )
-                existing_bookings_result = await db.execute(existing_bookings_query)
-                if existing_bookings_result.scalars().first():
-                    return None
-
-            for field, value in obj_in.dict(exclude_unset=True).items():
-                setattr(db_obj, field, value)
-            
-            await db.commit()
-            await db.refresh(db_obj)
-            return db_obj
-        except SQLAlchemyError as e:
-            await db.rollback()
-            raise Exception(f"Database error occurred: {str(e)}")
-        except ValueError as e:
+                .values(**obj_in.model_dump(exclude_unset=True))
+                .returning(Booking)
+            )
+        except IntegrityError as e:
             await db.rollback()
-            raise Exception(f"Validation error: {str(e)}")
-        except Exception as e:
+            if not _is_overlap(e):
+                raise
+            raise ValueError("Book is already booked in the specified period")
+        db_obj = result.scalars().first()
+        if not db_obj:
             await db.rollback()
-            raise Exception(f"Unexpected error occurred: {str(e)}")
+            await self._check_references(db, obj_in)
+            return None
+
+        await db.commit()
+        return db_obj
 
-    async def remove(self, db: AsyncSession, *, id: int) -> Optional[Booking]:
+    async def cancel(self, db: AsyncSession, *, id: int) -> Optional[Booking]:
         """
-        Remove a booking from the database.
+        Cancel a booking by marking it as inactive and ending it now.
+
+        The booking is updated with a single UPDATE ... RETURNING, without loading it first.
 
         Args:
             db (AsyncSession): The database session.
-            id (int): The ID of the booking to remove.
+            id (int): The ID of the booking to cancel.
 
         Returns:
-            Optional[Booking]: The removed booking object, or None if not found.
+            Optional[Booking]: The updated (canceled) booking object, or None if not found.
 
         Raises:
             SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
         """
-        try:
-            result = await db.execute(select(Booking).filter(Booking.id == id))
-            db_obj = result.scalars().first()
-            if not db_obj:
-                return None
-            await db.delete(db_obj)
-            await db.commit()
-            return db_obj
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error occurred: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error occurred: {str(e)}")
+        result = await db.execute(
+            update(Booking)
+            .where(Booking.id == id)
+            .values(active=False, end_time=datetime.now(timezone.utc))
+            .returning(Booking)
+        )
+        db_obj = result.scalars().first()
+        if not db_obj:
+            await db.rollback()
+            return None
+        await db.commit()
+        return db_obj
 
-    async def cancel(self, db: AsyncSession, *, id: int) -> Optional[Booking]:
+    async def cancel_expired(
+        self, db: AsyncSession, *, batch_size: int = 500, now: Optional[datetime] = None
+    ) -> int:
         """
-        Cancel a booking by marking it as inactive and adjusting the end time.
+        Deactivate all active bookings whose end time has passed.
+
+        Expired bookings are updated with bulk UPDATE statements instead of being loaded
+        and canceled one by one. Each statement covers at most `batch_size` bookings and
+        is committed on its own, so row locks are held only briefly even when a large
+        backlog has expired. Bookings are taken in end time order, which is a range scan
+        of the partial `ix_booking_active_end_time` index. The statement is a cached
+        lambda statement, so it is not rebuilt for every batch. Only the number of updated
+        rows is kept, so memory use does not grow with the size of the backlog.
 
         Args:
             db (AsyncSession): The database session.
-            id (int): The ID of the booking to cancel.
+            batch_size (int): Maximum number of bookings updated per transaction (default is 500).
+            now (Optional[datetime]): The time to compare end times with (default is the database clock).
 
         Returns:
-            Optional[Booking]: The updated (canceled) booking object, or None if not found.
+            int: The number of deactivated bookings.
 
         Raises:
+            ValueError: If `batch_size` is less than 1.
             SQLAlchemyError: If there's a database error during the operation.
-            Exception: For any unexpected errors.
         """
-        try:
-            result = await db.execute(select(Booking).filter(Booking.id == id))
-            db_obj = result.scalars().first()
-            if not db_obj:
-                return None
-            
-            db_obj.active = False
-            db_obj.end_time = datetime.utcnow() + timedelta(hours=3)
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        params = {"now": now, "batch_size": batch_size}
+        total = 0
+        while True:
+            result = await db.execute(_CANCEL_EXPIRED, params)
             await db.commit()
-            await db.refresh(db_obj)
-            return db_obj
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error occurred: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error occurred: {str(e)}")
-
-crud_booking = CRUDBooking()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+crud_booking = CRUDBooking(Booking)
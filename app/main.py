@@ -1,11 +1,43 @@
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.middleware import ETagMiddleware, SessionMiddleware
 
-app = FastAPI(title="Book Catalog API", docs_url='/')
+app = FastAPI(
+    title="Book Catalog API",
+    docs_url='/',
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse
+)
+
+app.add_middleware(SessionMiddleware)
+app.add_middleware(ETagMiddleware)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError) -> ORJSONResponse:
+    """
+    Translate validation errors raised by the CRUD layer into 400 responses.
+
+    Pydantic's `ValidationError` is also a `ValueError`, but here it means a response
+    could not be serialized, which is a server error; it is re-raised so that it is
+    logged and answered with a 500.
+    """
+    if isinstance(exc, ValidationError):
+        raise exc
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
+
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError) -> ORJSONResponse:
+    """
+    Translate unhandled database errors into 500 responses.
+    """
+    return ORJSONResponse(status_code=500, content={"detail": "Database error occurred"})
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -5,8 +5,8 @@ from app.core.init_db import Base
 
 book_genre_association = Table(
     'book_genre', Base.metadata,
-    Column('book_id', Integer, ForeignKey('book.id')),
-    Column('genre_id', Integer, ForeignKey('genre.id'))
+    Column('book_id', Integer, ForeignKey('book.id'), primary_key=True),
+    Column('genre_id', Integer, ForeignKey('genre.id'), primary_key=True, index=True)
 )
 
 class Book(Base):
@@ -25,10 +25,10 @@ class Book(Base):
     __tablename__ = 'book'
     
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    price = Column(Float)
+    title = Column(String)
+    price = Column(Float, index=True)
     pages = Column(Integer)
-    author_id = Column(Integer, ForeignKey('user.id'))
+    author_id = Column(Integer, ForeignKey('user.id'), index=True)
     
     genres = relationship('Genre', secondary=book_genre_association, back_populates='books')
     author = relationship('User', back_populates='books')
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Index, Integer, ForeignKey, DateTime, Boolean, func, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import relationship
 from app.core.init_db import Base
 
@@ -15,15 +16,30 @@ class Booking(Base):
         active (bool): Indicates whether the booking is currently active.
         book (relationship): A one-to-one relationship with Book.
         user (relationship): A one-to-one relationship with User.
+
+    Active bookings of the same book may not overlap; this is enforced by the
+    `no_overlap` exclusion constraint (GiST on book_id and the booked tstzrange).
     """
     __tablename__ = 'booking'
     
     id = Column(Integer, primary_key=True, index=True)
-    book_id = Column(Integer, ForeignKey('book.id'))
-    user_id = Column(Integer, ForeignKey('user.id'))
-    start_time = Column(DateTime(timezone=False))
-    end_time = Column(DateTime(timezone=False))
+    book_id = Column(Integer, ForeignKey('book.id'), index=True)
+    user_id = Column(Integer, ForeignKey('user.id'), index=True)
+    start_time = Column(DateTime(timezone=True))
+    end_time = Column(DateTime(timezone=True))
     active = Column(Boolean, default=True)
     
     book = relationship('Book')
     user = relationship('User')
+
+    __table_args__ = (
+        ExcludeConstraint(
+            ('book_id', '='),
+            (func.tstzrange(start_time, end_time), '&&'),
+            name='no_overlap',
+            using='gist',
+            where=text('active')
+        ),
+    )
+
+Index('ix_booking_active_end_time', Booking.end_time, postgresql_where=text('active'))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.core.init_db import Base
@@ -16,6 +16,8 @@ class Genre(Base):
     __tablename__ = 'genre'
     
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
+    name = Column(String)
     
     books = relationship('Book', secondary=book_genre_association, back_populates='genres')
+
+Index('ix_genre_name_lower', func.lower(Genre.name))
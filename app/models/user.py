@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.core.init_db import Base
@@ -17,8 +17,11 @@ class User(Base):
     __tablename__ = 'user'
     
     id = Column(Integer, primary_key=True, index=True)
-    first_name = Column(String, index=True)
-    last_name = Column(String, index=True)
-    avatar = Column(String, index=True)
+    first_name = Column(String)
+    last_name = Column(String)
+    avatar = Column(String)
     
     books = relationship('Book', back_populates='author')
+
+Index('ix_user_first_name_lower', func.lower(User.first_name))
+Index('ix_user_last_name_lower', func.lower(User.last_name))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 class Genre(BaseModel):
@@ -59,11 +59,21 @@ class Book(BookBase):
 
     Attributes:
         id (int): The unique identifier for the book.
+        author_id (Optional[int]): The unique identifier of the author of the book, or None
+            if the author has been deleted.
     """
     id: int
+    author_id: Optional[int]
     
-    class Config:
-        """
-        Configuration for the Pydantic model.
-        """
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class BookPage(BaseModel):
+    """
+    Pydantic model representing one page of books.
+
+    Attributes:
+        items (List[Book]): The books on the requested page.
+        total (int): The total number of books matching the query.
+    """
+    items: List[Book]
+    total: int
@@ -1,6 +1,11 @@
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator, ValidationError
+from zoneinfo import ZoneInfo
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing import Optional
+from app.core.config import settings
+
+_FMT = "%H:%M %d.%m.%Y"
+_TZ = ZoneInfo(settings.TIMEZONE)
 
 class BookingBase(BaseModel):
     """
@@ -15,6 +20,10 @@ class BookingBase(BaseModel):
     
     Validators:
         - `parse_datetime`: Converts `start_time` and `end_time` strings to `datetime` objects if they are in string format.
+        - `localize_datetime`: Interprets times without a UTC offset in the business time zone (`settings.TIMEZONE`).
+
+    Serializers:
+        - `serialize_datetime`: Renders `start_time` and `end_time` in the business time zone.
     """
     book_id: int
     user_id: int
@@ -39,11 +48,40 @@ class BookingBase(BaseModel):
         """
         if isinstance(value, str):
             try:
-                return datetime.strptime(value, "%H:%M %d.%m.%Y")
+                return datetime.strptime(value, _FMT)
             except ValueError:
                 raise ValueError("Time format should be HH:MM dd.mm.YYYY")
         return value
 
+    @field_validator('start_time', 'end_time')
+    def localize_datetime(cls, value: datetime) -> datetime:
+        """
+        Attaches the business time zone to naive `start_time` and `end_time` values.
+
+        Args:
+            cls (Type[BaseModel]): The class of the model.
+            value (datetime): The parsed value of the field.
+
+        Returns:
+            datetime: A timezone-aware datetime.
+        """
+        if value.tzinfo is None:
+            return value.replace(tzinfo=_TZ)
+        return value
+
+    @field_serializer('start_time', 'end_time')
+    def serialize_datetime(self, value: datetime) -> datetime:
+        """
+        Converts `start_time` and `end_time` to the business time zone for output.
+
+        Args:
+            value (datetime): The timezone-aware value of the field.
+
+        Returns:
+            datetime: The same instant in the business time zone.
+        """
+        return value.astimezone(_TZ)
+
 class BookingCreate(BookingBase):
     """
     Pydantic model for creating a booking. Extends `BookingBase` with no additional fields.
@@ -65,8 +103,4 @@ class Booking(BookingBase):
     """
     id: int
 
-    class Config:
-        """
-        Configuration for the Pydantic model.
-        """
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
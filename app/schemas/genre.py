@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class GenreBase(BaseModel):
     """
@@ -30,8 +30,4 @@ class Genre(GenreBase):
     """
     id: int
 
-    class Config:
-        """
-        Configuration for the Pydantic model.
-        """
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
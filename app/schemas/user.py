@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class UserBase(BaseModel):
     """
@@ -38,8 +38,4 @@ class User(UserBase):
     """
     id: int
 
-    class Config:
-        """
-        Configuration for the Pydantic model.
-        """
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
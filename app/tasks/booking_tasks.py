@@ -1,38 +1,92 @@
-from datetime import datetime, timedelta
-from sqlalchemy.future import select
-from app.core.init_db import async_session
+from app.core.init_db import async_session, engine
+from app.crud.crud_booking import crud_booking
 from app.models.book import Book
 from app.models.user import User
 from app.models.genre import Genre
-from app.models.booking import Booking
 from app.core.celery_app import celery_app
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from datetime import datetime
+from typing import Optional
 import asyncio
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_runner: Optional[asyncio.Runner] = None
+
+def _get_runner() -> asyncio.Runner:
+    """
+    Return the event loop runner of this worker process, creating it on first use.
+
+    The runner is kept for the lifetime of the process so that every task runs on the
+    same event loop and the database connections pooled by the engine stay usable
+    between tasks. The loop is a uvloop loop when uvloop is installed. On Python 3.12+
+    it uses the eager task factory, so coroutines that finish without suspending never
+    go through the loop's ready queue.
+
+    Returns:
+        asyncio.Runner: The runner of this worker process.
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            _runner.get_loop().set_task_factory(eager_task_factory)
+    return _runner
+
+@worker_process_init.connect
+def _reset_engine(**kwargs):
+    """
+    Drop the connection pool inherited from the parent process after a worker fork.
+
+    The module-level engine is created when the tasks are imported, before the pool
+    forks its workers. Each worker starts with its own empty pool, which then lives
+    for the whole process and is shared by all tasks it runs.
+    """
+    engine.sync_engine.dispose(close=False)
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_runner(**kwargs):
+    """
+    Close the pooled database connections and the event loop runner when the worker
+    process shuts down. Pool children get `worker_process_shutdown`, while a solo
+    worker runs tasks in the main process and only gets `worker_shutdown`.
+    """
+    global _runner
+    if _runner is not None:
+        _runner.run(engine.dispose())
+        _runner.close()
+        _runner = None
+
 @celery_app.task(name='check_bookings')
-def check_bookings():
+def check_bookings(batch_size: int = 500, now: Optional[datetime] = None):
     """
     Celery task that triggers the `update_bookings` coroutine to deactivate expired bookings.
 
     This function uses Celery's task decorator to schedule periodic checks for expired bookings. 
     It runs the `update_bookings` coroutine to handle the asynchronous operations.
+
+    Args:
+        batch_size (int): Maximum number of bookings deactivated per transaction (default is 500).
+        now (Optional[datetime]): The time to compare end times with (default is the database clock).
     """
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(update_bookings())
+    _get_runner().run(update_bookings(batch_size, now))
 
-async def update_bookings():
+async def update_bookings(batch_size: int = 500, now: Optional[datetime] = None):
     """
     Asynchronous coroutine to update and deactivate expired bookings.
 
-    This coroutine connects to the database, retrieves all active bookings that have expired (i.e., 
-    their end time is before the current time), and marks them as inactive. The changes are then 
-    committed to the database.
+    This coroutine connects to the database and marks all active bookings that have expired (i.e., 
+    their end time is before the current time) as inactive with `crud_booking.cancel_expired`, 
+    which updates them in batches of `batch_size` without loading them into Python.
+
+    Args:
+        batch_size (int): Maximum number of bookings deactivated per transaction (default is 500).
+        now (Optional[datetime]): The time to compare end times with (default is the database clock).
     """
     async with async_session() as session:
-        now = datetime.utcnow() + timedelta(hours=3)
-        result = await session.execute(
-            select(Booking).filter(Booking.end_time < now, Booking.active == True)
-        )
-        expired_bookings = result.scalars().all()
-        for booking in expired_bookings:
-            booking.active = False
-        await session.commit()
+        await crud_booking.cancel_expired(session, batch_size=batch_size, now=now)
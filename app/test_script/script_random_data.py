@@ -1,62 +1,108 @@
 import asyncio
 import random
+from typing import List
+from datetime import datetime, timedelta, timezone
 from faker import Faker
+from sqlalchemy import Table, text
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.init_db import async_session, Base
-from app.models.book import Book
+from app.models.book import Book, book_genre_association
 from app.models.booking import Booking
 from app.models.genre import Genre
 from app.models.user import User
 
 fake = Faker()
+fake.seed_instance(0)
+rng = random.Random(0)
+# A fixed vocabulary for titles and genre names, drawn once instead of asking Faker
+# for every sentence.
+WORDS = fake.words(nb=200, unique=True)
+
+async def reserve_ids(session: AsyncSession, table: Table, count: int) -> List[int]:
+    """
+    Take the next `count` values of a table's ID sequence.
+
+    COPY cannot return the generated IDs, so they are reserved up front and written
+    explicitly, which lets the rows that reference them be built before copying.
+
+    Args:
+        session (AsyncSession): The database session.
+        table (Table): The table whose `id` sequence is used.
+        count (int): The number of IDs to reserve.
+
+    Returns:
+        List[int]: The reserved IDs.
+    """
+    result = await session.execute(
+        text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+        {"table": f'"{table.name}"', "count": count}
+    )
+    return result.scalars().all()
 
 async def populate_database():
-    async with async_session() as session:
-        users = [
-            User(
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
-                avatar=fake.image_url()
-            ) for _ in range(20)
-        ]
-        
-        genres = [
-            Genre(
-                name=fake.word()
-            ) for _ in range(20)
-        ]
-        
-        books = [
-            Book(
-                title=fake.sentence(),
-                price=round(random.uniform(5.0, 50.0), 2),
-                pages=random.randint(100, 500),
-                author=users[random.randint(0, 19)]
-            ) for _ in range(20)
-        ]
-        
-        bookings = [
-            Booking(
-                book=books[random.randint(0, 19)],
-                user=users[random.randint(0, 19)],
-                start_time=fake.date_time_this_year(),
-                end_time=fake.date_time_this_year(),
-                active=random.choice([True, False])
-            ) for _ in range(20)
-        ]
-        
-        async with session.begin():
-            session.add_all(users)
-            session.add_all(genres)
-            session.add_all(books)
-            session.add_all(bookings)
-
-            for book in books:
-                num_genres = random.randint(1, 5)
-                selected_genres = random.sample(genres, num_genres)
-                book.genres.extend(selected_genres)
+    first_names = [fake.first_name() for _ in range(20)]
+    last_names = [fake.last_name() for _ in range(20)]
+    avatars = [f"https://picsum.photos/seed/{i}/200" for i in range(20)]
+    genre_names = rng.sample(WORDS, 20)
+    titles = [" ".join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize() for _ in range(20)]
+
+    # Each booking gets its own slot of the current year, so bookings are valid
+    # (start before end) and never overlap.
+    year_start = datetime(datetime.now(timezone.utc).year, 1, 1, tzinfo=timezone.utc)
+    slot = 365 * 86400 // 20
+    starts = [year_start + timedelta(seconds=i * slot + rng.randrange(slot // 2)) for i in range(20)]
+    ends = [start + timedelta(seconds=rng.randint(3600, slot // 2)) for start in starts]
+
+    async with async_session.begin() as session:
+        user_ids = await reserve_ids(session, User.__table__, 20)
+        genre_ids = await reserve_ids(session, Genre.__table__, 20)
+        book_ids = await reserve_ids(session, Book.__table__, 20)
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # The asyncpg connection; COPY is the fastest way to load rows into PostgreSQL.
+        copy = raw_connection.driver_connection.copy_records_to_table
+
+        await copy(
+            User.__tablename__,
+            columns=["id", "first_name", "last_name", "avatar"],
+            records=list(zip(user_ids, first_names, last_names, avatars))
+        )
+        await copy(
+            Genre.__tablename__,
+            columns=["id", "name"],
+            records=list(zip(genre_ids, genre_names))
+        )
+        await copy(
+            Book.__tablename__,
+            columns=["id", "title", "price", "pages", "author_id"],
+            records=[
+                (book_id, title, round(rng.uniform(5.0, 50.0), 2), rng.randint(100, 500), author_id)
+                for book_id, title, author_id in zip(book_ids, titles, rng.choices(user_ids, k=20))
+            ]
+        )
+        await copy(
+            book_genre_association.name,
+            columns=["book_id", "genre_id"],
+            records=[
+                (book_id, genre_id)
+                for book_id in book_ids
+                for genre_id in rng.sample(genre_ids, rng.randint(1, 5))
+            ]
+        )
+        await copy(
+            Booking.__tablename__,
+            columns=["book_id", "user_id", "start_time", "end_time", "active"],
+            records=list(zip(
+                rng.choices(book_ids, k=20),
+                rng.choices(user_ids, k=20),
+                starts,
+                ends,
+                rng.choices([True, False], k=20)
+            ))
+        )
 
 if __name__ == "__main__":
     asyncio.run(populate_database())